@@ -1,10 +1,15 @@
 """Flask web application for the RemindMeX bot."""
 
+import functools
+import hashlib
 import logging
 import os
+import time
 from datetime import datetime
 
-from flask import Flask, jsonify, render_template_string
+from flask import Flask, Response, jsonify, request, stream_with_context
+from flask_compress import Compress
+from sqlalchemy import select
 
 from config import Config
 from models import init_db, get_session, Reminder
@@ -20,6 +25,11 @@ logger = logging.getLogger(__name__)
 # Create Flask app
 app = Flask(__name__)
 
+# Compress text responses (status page HTML, JSON APIs) on the wire
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 500
+Compress(app)
+
 # HTML template for the status page
 STATUS_PAGE_HTML = """
 <!DOCTYPE html>
@@ -29,224 +39,7 @@ STATUS_PAGE_HTML = """
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>RemindMeX Bot Status</title>
     <link href="https://fonts.googleapis.com/css2?family=Space+Mono:wght@400;700&family=Sora:wght@300;400;600;700&display=swap" rel="stylesheet">
-    <style>
-        :root {
-            --bg-primary: #0a0a0f;
-            --bg-secondary: #12121a;
-            --bg-card: #1a1a24;
-            --accent-cyan: #00f5d4;
-            --accent-magenta: #f72585;
-            --accent-yellow: #fee440;
-            --text-primary: #ffffff;
-            --text-secondary: #a0a0b0;
-            --border-color: #2a2a3a;
-        }
-        
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Sora', sans-serif;
-            background: var(--bg-primary);
-            color: var(--text-primary);
-            min-height: 100vh;
-            position: relative;
-            overflow-x: hidden;
-        }
-        
-        body::before {
-            content: '';
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: 
-                radial-gradient(ellipse at 20% 20%, rgba(0, 245, 212, 0.08) 0%, transparent 50%),
-                radial-gradient(ellipse at 80% 80%, rgba(247, 37, 133, 0.08) 0%, transparent 50%),
-                radial-gradient(ellipse at 50% 50%, rgba(254, 228, 64, 0.03) 0%, transparent 70%);
-            pointer-events: none;
-            z-index: 0;
-        }
-        
-        .container {
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 60px 24px;
-            position: relative;
-            z-index: 1;
-        }
-        
-        header {
-            text-align: center;
-            margin-bottom: 60px;
-        }
-        
-        .logo {
-            font-family: 'Space Mono', monospace;
-            font-size: 3rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, var(--accent-cyan) 0%, var(--accent-magenta) 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin-bottom: 12px;
-            letter-spacing: -2px;
-        }
-        
-        .tagline {
-            color: var(--text-secondary);
-            font-size: 1.1rem;
-            font-weight: 300;
-        }
-        
-        .status-badge {
-            display: inline-flex;
-            align-items: center;
-            gap: 8px;
-            padding: 10px 20px;
-            background: var(--bg-card);
-            border: 1px solid var(--border-color);
-            border-radius: 50px;
-            margin-top: 24px;
-            font-family: 'Space Mono', monospace;
-            font-size: 0.9rem;
-        }
-        
-        .status-dot {
-            width: 10px;
-            height: 10px;
-            border-radius: 50%;
-            background: var(--accent-cyan);
-            box-shadow: 0 0 12px var(--accent-cyan);
-            animation: pulse 2s infinite;
-        }
-        
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.5; }
-        }
-        
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(240px, 1fr));
-            gap: 20px;
-            margin-bottom: 48px;
-        }
-        
-        .stat-card {
-            background: var(--bg-card);
-            border: 1px solid var(--border-color);
-            border-radius: 16px;
-            padding: 28px;
-            transition: all 0.3s ease;
-        }
-        
-        .stat-card:hover {
-            border-color: var(--accent-cyan);
-            transform: translateY(-2px);
-        }
-        
-        .stat-label {
-            font-size: 0.85rem;
-            color: var(--text-secondary);
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-bottom: 8px;
-        }
-        
-        .stat-value {
-            font-family: 'Space Mono', monospace;
-            font-size: 2.5rem;
-            font-weight: 700;
-            color: var(--accent-cyan);
-        }
-        
-        .stat-card:nth-child(2) .stat-value { color: var(--accent-yellow); }
-        .stat-card:nth-child(3) .stat-value { color: var(--accent-magenta); }
-        
-        .section {
-            background: var(--bg-card);
-            border: 1px solid var(--border-color);
-            border-radius: 16px;
-            padding: 32px;
-            margin-bottom: 24px;
-        }
-        
-        .section-title {
-            font-size: 1.2rem;
-            font-weight: 600;
-            margin-bottom: 20px;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }
-        
-        .section-title::before {
-            content: '';
-            width: 4px;
-            height: 20px;
-            background: var(--accent-cyan);
-            border-radius: 2px;
-        }
-        
-        .reminder-list {
-            list-style: none;
-        }
-        
-        .reminder-item {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 16px 0;
-            border-bottom: 1px solid var(--border-color);
-        }
-        
-        .reminder-item:last-child {
-            border-bottom: none;
-        }
-        
-        .reminder-user {
-            font-family: 'Space Mono', monospace;
-            color: var(--accent-cyan);
-        }
-        
-        .reminder-time {
-            color: var(--text-secondary);
-            font-size: 0.9rem;
-        }
-        
-        .empty-state {
-            text-align: center;
-            padding: 40px;
-            color: var(--text-secondary);
-        }
-        
-        .usage-code {
-            background: var(--bg-secondary);
-            border-radius: 8px;
-            padding: 20px;
-            font-family: 'Space Mono', monospace;
-            font-size: 0.9rem;
-            color: var(--accent-yellow);
-            overflow-x: auto;
-        }
-        
-        footer {
-            text-align: center;
-            padding: 40px 0;
-            color: var(--text-secondary);
-            font-size: 0.85rem;
-        }
-        
-        footer a {
-            color: var(--accent-cyan);
-            text-decoration: none;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ css_url }}">
 </head>
 <body>
     <div class="container">
@@ -311,47 +104,96 @@ STATUS_PAGE_HTML = """
 </html>
 """
 
+# Compile the template once at import time; render_template_string would
+# re-parse and re-compile the template source on every request.
+_STATUS_TEMPLATE = app.jinja_env.from_string(STATUS_PAGE_HTML)
+
+# Version the stylesheet URL by content hash so it can be cached immutably:
+# the URL changes whenever the file does, never serving a stale sheet
+with open(os.path.join(app.static_folder, "status.css"), "rb") as f:
+    _CSS_URL = f"/static/status.css?v={hashlib.md5(f.read()).hexdigest()[:12]}"
+
+
+@app.after_request
+def cache_static_assets(response):
+    """Let browsers keep static assets for a year; URLs are content-versioned."""
+    if request.path.startswith("/static/"):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+
+@functools.lru_cache(maxsize=1)
+def _server_time_str(second_bucket: int) -> str:
+    """Format the server time once per second; strftime is surprisingly costly."""
+    return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+
 
 @app.route("/")
 def index():
     """Render the status page."""
-    try:
-        from bot import get_bot
-        bot = get_bot()
-        stats = bot.get_stats()
-    except Exception as e:
-        logger.error(f"Error getting bot stats: {e}")
-        stats = {
-            "total_reminders": 0,
-            "pending_reminders": 0,
-            "sent_reminders": 0,
-            "bot_username": Config.BOT_USERNAME
-        }
-    
-    # Get upcoming reminders
+    # One session covers both the stats query and the upcoming-reminders
+    # query, instead of four sequential round-trips on separate sessions.
     session = get_session()
     try:
-        upcoming_reminders = session.query(Reminder).filter(
-            Reminder.is_sent == False
-        ).order_by(Reminder.remind_at).limit(10).all()
+        try:
+            from bot import get_bot
+            bot = get_bot()
+            stats = bot.get_stats(session=session)
+        except Exception as e:
+            logger.error("Error getting bot stats: %s", e)
+            stats = {
+                "total_reminders": 0,
+                "pending_reminders": 0,
+                "sent_reminders": 0,
+                "bot_username": Config.BOT_USERNAME
+            }
+
+        # Select only the columns the template renders; full ORM rows would
+        # also hydrate original_text/error_message and the identity map
+        upcoming_reminders = session.execute(
+            select(Reminder.id, Reminder.requester_username, Reminder.remind_at)
+            .where(Reminder.is_sent == False)
+            .order_by(Reminder.remind_at)
+            .limit(10)
+        ).all()
     finally:
         session.close()
-    
-    return render_template_string(
-        STATUS_PAGE_HTML,
-        stats=stats,
-        upcoming_reminders=upcoming_reminders,
-        current_time=datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+
+    # Let browsers/CDNs short-circuit with a 304 while the stats are fresh.
+    # Flask-Compress suffixes the outgoing ETag with the encoding (e.g.
+    # "<hash>:br"), so clients revalidate with the suffixed tag; match on
+    # the bare hash prefix rather than exact equality
+    etag = hashlib.md5(
+        repr((stats, [r.id for r in upcoming_reminders])).encode()
+    ).hexdigest()
+    if any(tag == etag or tag.startswith(etag + ":") for tag in request.if_none_match):
+        return "", 304
+
+    # Stream the template output so the first bytes go out before the
+    # reminders loop finishes rendering
+    response = Response(
+        stream_with_context(_STATUS_TEMPLATE.stream(
+            stats=stats,
+            upcoming_reminders=upcoming_reminders,
+            current_time=_server_time_str(int(time.time())),
+            css_url=_CSS_URL
+        )),
+        mimetype="text/html"
     )
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "public, max-age=10"
+    return response
 
 
 @app.route("/health")
 def health():
     """Health check endpoint for Render."""
-    return jsonify({
+    response = jsonify({
         "status": "healthy",
         "timestamp": datetime.utcnow().isoformat()
     })
+    response.headers["Cache-Control"] = "no-store"
+    return response
 
 
 @app.route("/api/stats")
@@ -361,9 +203,17 @@ def api_stats():
         from bot import get_bot
         bot = get_bot()
         stats = bot.get_stats()
-        return jsonify(stats)
+
+        etag = hashlib.md5(repr(stats).encode()).hexdigest()
+        if etag in request.if_none_match:
+            return "", 304
+
+        response = jsonify(stats)
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "public, max-age=10"
+        return response
     except Exception as e:
-        logger.error(f"Error getting stats: {e}")
+        logger.error("Error getting stats: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
@@ -383,7 +233,7 @@ def api_scheduler():
             }
         })
     except Exception as e:
-        logger.error(f"Error getting scheduler stats: {e}")
+        logger.error("Error getting scheduler stats: %s", e)
         return jsonify({"error": str(e)}), 500
 
 
@@ -399,7 +249,7 @@ def create_app():
         logger.info("X API credentials validated successfully")
     except ValueError as e:
         credentials_valid = False
-        logger.warning(f"X API credentials not configured: {e}")
+        logger.warning("X API credentials not configured: %s", e)
         logger.warning("Bot will not run until credentials are added to environment variables")
     
     # Only start the scheduler if we have valid credentials
@@ -410,9 +260,9 @@ def create_app():
         try:
             from bot import get_bot
             bot = get_bot()
-            logger.info(f"Bot initialized as @{bot.bot_username}")
+            logger.info("Bot initialized as @%s", bot.bot_username)
         except Exception as e:
-            logger.error(f"Error initializing bot: {e}")
+            logger.error("Error initializing bot: %s", e)
     
     return app
 
@@ -1,29 +1,62 @@
 """Core bot logic for interacting with the X API."""
 
+import hashlib
+import heapq
+import json
 import logging
 import time
 import random
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Callable, TypeVar, Any
+from typing import Optional, List, Callable, Tuple, TypeVar, Any
 from functools import wraps
 
 import tweepy
+from sqlalchemy import bindparam, case, func, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import defer
 
 from config import Config
-from models import get_session, Reminder, ProcessedMention, BotState, init_db
+from models import get_session, session_scope, Reminder, ProcessedMention, BotState, init_db
 from time_parser import parse_reminder_time, time_parser
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Logging is configured centrally in app.py
 logger = logging.getLogger(__name__)
 
 # Type variable for generic return type
 T = TypeVar('T')
 
+# How long to reuse a computed stats snapshot before hitting the database again
+STATS_CACHE_TTL = 10  # seconds
+
+# How many confirmation replies to post concurrently; kept small so a burst of
+# mentions doesn't blow through the create-tweet rate limit
+REPLY_CONCURRENCY = 5
+
+# How many recently processed tweet IDs to keep in memory for dedup; sized to
+# comfortably cover a week of mention traffic
+RECENT_PROCESSED_CAPACITY = 10_000
+
+# How many due reminders to pull per tick; bounds the batch so a huge backlog
+# can't stall a single job run (the next tick picks up the rest)
+DUE_BATCH_LIMIT = 100
+
+# The due-reminder SELECT runs every tick with only :now changing, so it is
+# built as a lambda statement: SQLAlchemy caches the statement construction
+# and compilation and just swaps in the new parameter each time. The two TEXT
+# columns are deferred -- composing the reply needs neither, and skipping them
+# keeps arbitrarily long tweet bodies off the wire (and un-TOASTed on Postgres)
+_DUE_REMINDERS_STMT = lambda_stmt(
+    lambda: select(Reminder)
+    .options(defer(Reminder.original_text), defer(Reminder.error_message))
+    .where(Reminder.is_sent == False, Reminder.remind_at <= bindparam("now"))
+    .order_by(Reminder.remind_at)
+    .limit(DUE_BATCH_LIMIT)
+)
+
 
 def with_rate_limit_retry(func: Callable[..., T]) -> Callable[..., T]:
     """
@@ -48,23 +81,23 @@ def with_rate_limit_retry(func: Callable[..., T]) -> Callable[..., T]:
                     # Calculate delay with exponential backoff + jitter
                     delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
                     logger.warning(
-                        f"Rate limited on {func.__name__}. "
-                        f"Retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})"
+                        "Rate limited on %s. Retrying in %.1fs (attempt %s/%s)",
+                        func.__name__, delay, attempt + 1, max_retries
                     )
                     time.sleep(delay)
                 else:
-                    logger.error(f"Rate limit exceeded after {max_retries} retries on {func.__name__}")
+                    logger.error("Rate limit exceeded after %s retries on %s", max_retries, func.__name__)
             except tweepy.TwitterServerError as e:
                 last_exception = e
                 if attempt < max_retries - 1:
                     delay = min(base_delay * (2 ** attempt) + random.uniform(0, 1), max_delay)
                     logger.warning(
-                        f"Twitter server error on {func.__name__}: {e}. "
-                        f"Retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})"
+                        "Twitter server error on %s: %s. Retrying in %.1fs (attempt %s/%s)",
+                        func.__name__, e, delay, attempt + 1, max_retries
                     )
                     time.sleep(delay)
                 else:
-                    logger.error(f"Twitter server error after {max_retries} retries on {func.__name__}")
+                    logger.error("Twitter server error after %s retries on %s", max_retries, func.__name__)
         
         # If we've exhausted all retries, raise the last exception
         if last_exception:
@@ -91,59 +124,175 @@ class RemindMeBot:
             wait_on_rate_limit=True
         )
         
-        # Get our bot's user ID
-        self.bot_user = self.client.get_me()
-        if self.bot_user and self.bot_user.data:
-            self.bot_user_id = self.bot_user.data.id
-            self.bot_username = self.bot_user.data.username
-            logger.info(f"Bot initialized as @{self.bot_username} (ID: {self.bot_user_id})")
-        else:
-            raise RuntimeError("Could not authenticate with X API")
-    
-    def get_last_mention_id(self) -> Optional[str]:
-        """Get the ID of the last processed mention from the database."""
-        session = get_session()
-        try:
-            state = session.query(BotState).filter_by(key="last_mention_id").first()
-            return state.value if state else None
-        finally:
-            session.close()
-    
-    def set_last_mention_id(self, mention_id: str):
-        """Store the ID of the last processed mention."""
-        session = get_session()
-        try:
+        # Cached stats snapshot (see get_stats)
+        self._stats_cache = None
+        self._stats_cached_at = 0.0
+
+        with session_scope() as session:
+            # Resolve our own identity from the BotState cache when possible;
+            # get_me() is a network round-trip and eats rate limit on every
+            # restart otherwise. The cache is keyed by a hash of the bearer
+            # token so swapping credentials invalidates it.
+            self._load_bot_identity(session)
+
+            # This process is the only writer of last_mention_id, so keep it
+            # in memory and only touch the database on change
             state = session.query(BotState).filter_by(key="last_mention_id").first()
-            if state:
-                state.value = mention_id
-                state.updated_at = datetime.utcnow()
-            else:
-                state = BotState(key="last_mention_id", value=mention_id)
-                session.add(state)
-            session.commit()
-        finally:
-            session.close()
-    
-    def is_mention_processed(self, tweet_id: str) -> bool:
+            self._last_mention_id = state.value if state else None
+
+            # Min-heap of pending remind_at times so the reminder tick can
+            # skip the database entirely while nothing is due
+            self._due_heap = [
+                row.remind_at
+                for row in session.query(Reminder.remind_at)
+                .filter(Reminder.is_sent == False)
+                .all()
+            ]
+            heapq.heapify(self._due_heap)
+
+            # LRU of recently processed tweet IDs so mention dedup normally
+            # never leaves the process; the database is only probed for IDs
+            # this cache hasn't seen
+            self._recent_processed = OrderedDict()
+            recent = (
+                session.query(ProcessedMention.tweet_id)
+                .order_by(ProcessedMention.id.desc())
+                .limit(RECENT_PROCESSED_CAPACITY)
+                .all()
+            )
+            for row in reversed(recent):
+                self._recent_processed[row.tweet_id] = None
+
+    def _remember_processed(self, tweet_ids: List[int]):
+        """Add tweet IDs to the in-memory dedup cache, evicting the oldest."""
+        for tweet_id in tweet_ids:
+            self._recent_processed[tweet_id] = None
+            self._recent_processed.move_to_end(tweet_id)
+        while len(self._recent_processed) > RECENT_PROCESSED_CAPACITY:
+            self._recent_processed.popitem(last=False)
+
+    def _load_bot_identity(self, session):
+        """Load the bot's user ID/username, preferring the BotState cache over get_me()."""
+        token_hash = hashlib.sha256(Config.X_BEARER_TOKEN.encode()).hexdigest()
+
+        state = session.query(BotState).filter_by(key="bot_identity").first()
+        if state and state.value:
+            try:
+                cached = json.loads(state.value)
+            except ValueError:
+                cached = None
+            if cached and cached.get("token_hash") == token_hash:
+                self.bot_user_id = cached["id"]
+                self.bot_username = cached["username"]
+                logger.info("Bot identity loaded from cache: @%s (ID: %s)", self.bot_username, self.bot_user_id)
+                return
+
+        # Cache miss (first boot or rotated credentials): ask the API
+        bot_user = self.client.get_me()
+        if not (bot_user and bot_user.data):
+            raise RuntimeError("Could not authenticate with X API")
+
+        self.bot_user_id = bot_user.data.id
+        self.bot_username = bot_user.data.username
+        logger.info("Bot initialized as @%s (ID: %s)", self.bot_username, self.bot_user_id)
+
+        value = json.dumps({
+            "token_hash": token_hash,
+            "id": self.bot_user_id,
+            "username": self.bot_username,
+        })
+        if state:
+            state.value = value
+        else:
+            session.add(BotState(key="bot_identity", value=value))
+        session.commit()
+
+    def get_last_mention_id(self, session=None) -> Optional[str]:
+        """Get the ID of the last processed mention (cached in memory)."""
+        return self._last_mention_id
+
+    def set_last_mention_id(self, mention_id: int, session):
+        """Store the ID of the last processed mention and write through to the DB."""
+        self._last_mention_id = mention_id
+        state = session.query(BotState).filter_by(key="last_mention_id").first()
+        if state:
+            state.value = str(mention_id)
+        else:
+            state = BotState(key="last_mention_id", value=str(mention_id))
+            session.add(state)
+        session.commit()
+
+    def is_mention_processed(self, tweet_id: int, session) -> bool:
         """Check if a mention has already been processed."""
-        session = get_session()
-        try:
-            exists = session.query(ProcessedMention).filter_by(tweet_id=tweet_id).first()
-            return exists is not None
-        finally:
-            session.close()
-    
-    def mark_mention_processed(self, tweet_id: str):
+        if tweet_id in self._recent_processed:
+            return True
+        # EXISTS returns a bare boolean; no row hydration or ORM construction
+        return session.query(
+            session.query(ProcessedMention).filter_by(tweet_id=tweet_id).exists()
+        ).scalar()
+
+    def _filter_already_processed(self, tweet_ids: List[int], session) -> set:
+        """
+        Return the subset of tweet_ids that have already been processed.
+
+        The in-memory LRU answers for recent IDs; only the misses go to the
+        database, in a single IN query for the whole batch rather than one
+        SELECT per mention.
+        """
+        already_processed = {
+            tweet_id for tweet_id in tweet_ids
+            if tweet_id in self._recent_processed
+        }
+        unknown_ids = [t for t in tweet_ids if t not in already_processed]
+        if unknown_ids:
+            already_processed.update(
+                row.tweet_id
+                for row in session.query(ProcessedMention.tweet_id)
+                .filter(ProcessedMention.tweet_id.in_(unknown_ids))
+                .all()
+            )
+        return already_processed
+
+    def mark_mention_processed(self, tweet_id: int, session):
         """Mark a mention as processed."""
-        session = get_session()
+        self.mark_mentions_processed([tweet_id], session)
+
+    def mark_mentions_processed(self, tweet_ids: List[int], session):
+        """Mark a batch of mentions as processed with a single INSERT."""
+        if not tweet_ids:
+            return
+        self._insert_ignore(
+            ProcessedMention,
+            [{"tweet_id": tweet_id} for tweet_id in tweet_ids],
+            ["tweet_id"],
+            session,
+        )
+        self._remember_processed(tweet_ids)
+
+    @staticmethod
+    def _insert_ignore(model, rows: List[dict], conflict_columns: List[str], session):
+        """Bulk-insert rows, silently skipping ones that violate a unique key."""
+        dialect = session.get_bind().dialect.name
+
+        if dialect == "postgresql":
+            stmt = pg_insert(model).on_conflict_do_nothing(
+                index_elements=conflict_columns
+            )
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(model).on_conflict_do_nothing(
+                index_elements=conflict_columns
+            )
+        else:
+            stmt = model.__table__.insert()
+
         try:
-            processed = ProcessedMention(tweet_id=tweet_id)
-            session.add(processed)
+            # Passing the rows as parameters (instead of inlining them with
+            # .values()) lets SQLAlchemy use its executemany/insertmanyvalues
+            # fast path and reuse one compiled statement per batch
+            session.execute(stmt, rows)
             session.commit()
         except IntegrityError:
-            session.rollback()  # Already processed
-        finally:
-            session.close()
+            session.rollback()  # Duplicates already present
     
     @with_rate_limit_retry
     def _fetch_mentions_api(self, since_id: Optional[str]):
@@ -157,12 +306,12 @@ class RemindMeBot:
             user_fields=["username"]
         )
     
-    def fetch_mentions(self) -> List[dict]:
+    def fetch_mentions(self, session) -> List[dict]:
         """Fetch recent mentions of the bot with rate limit handling."""
         mentions = []
-        
+
         try:
-            since_id = self.get_last_mention_id()
+            since_id = self.get_last_mention_id(session)
             
             # Fetch mentions using the v2 API with retry logic
             response = self._fetch_mentions_api(since_id)
@@ -176,7 +325,7 @@ class RemindMeBot:
                 
                 for tweet in response.data:
                     mention = {
-                        "id": str(tweet.id),
+                        "id": int(tweet.id),
                         "text": tweet.text,
                         "author_id": str(tweet.author_id),
                         "author_username": users_map.get(tweet.author_id, "unknown"),
@@ -189,96 +338,62 @@ class RemindMeBot:
                     if tweet.referenced_tweets:
                         for ref in tweet.referenced_tweets:
                             if ref.type == "replied_to":
-                                mention["replied_to_tweet_id"] = str(ref.id)
+                                mention["replied_to_tweet_id"] = int(ref.id)
                                 break
                     
                     mentions.append(mention)
                 
-                logger.info(f"Fetched {len(mentions)} new mentions")
+                logger.info("Fetched %s new mentions", len(mentions))
             else:
                 logger.debug("No new mentions found")
                 
         except tweepy.TweepyException as e:
-            logger.error(f"Error fetching mentions: {e}")
+            logger.error("Error fetching mentions: %s", e)
         
         return mentions
     
-    def process_mention(self, mention: dict) -> Optional[Reminder]:
+    def _prepare_reminder(self, mention: dict) -> Tuple[Optional[dict], bool]:
         """
-        Process a single mention and create a reminder if valid.
-        
-        Returns the created Reminder object, or None if invalid.
+        Validate a mention and build the reminder row for batch insertion.
+
+        Dedup against processed_mentions is handled by check_mentions, which
+        prefilters the batch and records processed IDs in bulk afterwards.
+        Replies (confirmation or error) are also the caller's job, sent after
+        the batch is recorded.
+
+        Returns (column values for the new reminder, False), or (None, True)
+        when the time couldn't be parsed and an error reply is owed, or
+        (None, False) for mentions to skip silently.
         """
         tweet_id = mention["id"]
-        
-        # Skip if already processed
-        if self.is_mention_processed(tweet_id):
-            logger.debug(f"Mention {tweet_id} already processed, skipping")
-            return None
-        
+
         # Skip mentions from the bot itself to prevent self-replies
         if mention["author_id"] == str(self.bot_user_id):
-            logger.debug(f"Mention {tweet_id} is from the bot itself, skipping")
-            self.mark_mention_processed(tweet_id)
-            return None
-        
+            logger.debug("Mention %s is from the bot itself, skipping", tweet_id)
+            return None, False
+
         # Parse the time from the mention
         target_time, duration_text = parse_reminder_time(mention["text"])
-        
+
         if not target_time:
-            logger.info(f"Could not parse time from mention {tweet_id}: {mention['text']}")
-            self.mark_mention_processed(tweet_id)
-            # Optionally reply with an error message
-            self._reply_with_error(mention)
-            return None
-        
-        # Determine what tweet to reply to
-        # If the mention is a reply to another tweet, we reply to the mention itself
-        # so the user gets notified
-        reply_to_id = tweet_id
-        
-        # Create the reminder
-        session = get_session()
-        try:
-            reminder = Reminder(
-                source_tweet_id=tweet_id,
-                reply_to_tweet_id=reply_to_id,
-                requester_user_id=mention["author_id"],
-                requester_username=mention["author_username"],
-                original_text=mention["text"],
-                duration_text=duration_text,
-                remind_at=target_time,
-                created_at=datetime.utcnow(),
-                is_sent=False
-            )
-            session.add(reminder)
-            session.commit()
-            
-            logger.info(
-                f"Created reminder for @{mention['author_username']}: "
-                f"'{duration_text}' -> {target_time.strftime('%Y-%m-%d %H:%M:%S UTC')}"
-            )
-            
-            # Mark as processed
-            self.mark_mention_processed(tweet_id)
-            
-            # Send confirmation reply
-            self._reply_with_confirmation(mention, target_time, duration_text)
-            
-            # Update last mention ID
-            self.set_last_mention_id(tweet_id)
-            
-            return reminder
-            
-        except IntegrityError:
-            session.rollback()
-            logger.warning(f"Reminder for tweet {tweet_id} already exists")
-            return None
-        finally:
-            session.close()
+            logger.info("Could not parse time from mention %s: %s", tweet_id, mention['text'])
+            return None, True
+
+        # Reply to the mention itself so the user gets notified, even when
+        # the mention was itself a reply to another tweet
+        return {
+            "source_tweet_id": tweet_id,
+            "reply_to_tweet_id": tweet_id,
+            "requester_user_id": mention["author_id"],
+            "requester_username": mention["author_username"],
+            "original_text": mention["text"],
+            "duration_text": duration_text,
+            "remind_at": target_time,
+            "is_sent": False,
+        }, False
     
     @with_rate_limit_retry
-    def _create_tweet_api(self, text: str, in_reply_to_tweet_id: str):
+    def _create_tweet_api(self, text: str, in_reply_to_tweet_id: int):
         """Internal method to create a tweet with retry logic."""
         return self.client.create_tweet(
             text=text,
@@ -298,10 +413,10 @@ class RemindMeBot:
             )
             
             self._create_tweet_api(reply_text, mention["id"])
-            logger.info(f"Sent confirmation reply to @{mention['author_username']}")
+            logger.info("Sent confirmation reply to @%s", mention['author_username'])
             
         except tweepy.TweepyException as e:
-            logger.error(f"Error sending confirmation reply: {e}")
+            logger.error("Error sending confirmation reply: %s", e)
     
     def _reply_with_error(self, mention: dict):
         """Reply with an error message when we can't parse the time."""
@@ -315,106 +430,217 @@ class RemindMeBot:
             )
             
             self._create_tweet_api(reply_text, mention["id"])
-            logger.info(f"Sent error reply to @{mention['author_username']}")
+            logger.info("Sent error reply to @%s", mention['author_username'])
             
         except tweepy.TweepyException as e:
-            logger.error(f"Error sending error reply: {e}")
+            logger.error("Error sending error reply: %s", e)
     
     def check_mentions(self):
         """Check for new mentions and process them."""
         logger.info("Checking for new mentions...")
-        mentions = self.fetch_mentions()
-        
-        for mention in mentions:
-            self.process_mention(mention)
+        # One session covers the whole poll cycle instead of each helper
+        # opening and closing its own
+        with session_scope() as session:
+            mentions = self.fetch_mentions(session)
+            if not mentions:
+                return
+
+            # Prefilter already-processed mentions for the whole batch
+            tweet_ids = [mention["id"] for mention in mentions]
+            already_processed = self._filter_already_processed(tweet_ids, session)
+
+            newly_processed = []
+            reminder_rows = []
+            confirmations = []
+            error_replies = []
+            for mention in mentions:
+                if mention["id"] in already_processed:
+                    logger.debug("Mention %s already processed, skipping", mention['id'])
+                    continue
+                row, parse_failed = self._prepare_reminder(mention)
+                if row:
+                    reminder_rows.append(row)
+                    confirmations.append((mention, row["remind_at"], row["duration_text"]))
+                elif parse_failed:
+                    error_replies.append(mention)
+                newly_processed.append(mention["id"])
+
+            # One INSERT for all new reminders, one for the processed IDs,
+            # one BotState update -- instead of 3 round-trips per mention
+            if reminder_rows:
+                self._insert_ignore(Reminder, reminder_rows, ["source_tweet_id"], session)
+                logger.info("Created %s reminder(s)", len(reminder_rows))
+                for row in reminder_rows:
+                    heapq.heappush(self._due_heap, row["remind_at"])
+            self.mark_mentions_processed(newly_processed, session)
+            if newly_processed:
+                self.set_last_mention_id(max(newly_processed), session)
+
+            # Replies -- confirmations and parse-error notices alike -- go out
+            # after the batch is durably recorded, so a crash or a rate-limit
+            # sleep mid-reply can't stall the inserts or re-send on restart.
+            # Each reply is a ~100-300ms network round-trip, so overlap them
+            # with a small thread pool instead of paying N round-trips serially.
+            if confirmations or error_replies:
+                for mention, target_time, duration_text in confirmations:
+                    logger.info(
+                        "Created reminder for @%s: '%s' -> %s",
+                        mention['author_username'], duration_text,
+                        target_time.strftime('%Y-%m-%d %H:%M:%S UTC')
+                    )
+                with ThreadPoolExecutor(max_workers=REPLY_CONCURRENCY) as executor:
+                    for mention, target_time, duration_text in confirmations:
+                        executor.submit(
+                            self._reply_with_confirmation, mention, target_time, duration_text
+                        )
+                    for mention in error_replies:
+                        executor.submit(self._reply_with_error, mention)
     
-    def get_due_reminders(self) -> List[Reminder]:
+    def get_due_reminders(self, session=None) -> List[Reminder]:
         """Get all reminders that are due to be sent."""
-        session = get_session()
+        owns_session = session is None
+        if owns_session:
+            session = get_session()
         try:
             now = datetime.utcnow()
-            reminders = session.query(Reminder).filter(
-                Reminder.is_sent == False,
-                Reminder.remind_at <= now
-            ).all()
+            reminders = session.scalars(_DUE_REMINDERS_STMT, {"now": now}).all()
             return reminders
         finally:
-            session.close()
-    
-    def send_reminder(self, reminder: Reminder) -> bool:
-        """Send a reminder reply and update the database with rate limit handling."""
-        session = get_session()
+            if owns_session:
+                session.close()
+
+    def send_reminder(self, reminder: Reminder, session) -> Optional[dict]:
+        """
+        Post a reminder reply with rate limit handling.
+
+        Returns the column updates for the batched mark-as-sent UPDATE in
+        process_due_reminders, or None if the send failed. Failures note
+        their error on the ORM instance; nothing is committed here -- the
+        whole tick commits once.
+        """
         try:
-            # Refresh the reminder from the database
-            reminder = session.query(Reminder).get(reminder.id)
-            
+            # The instance is already attached to this session and fresh from
+            # get_due_reminders; no need to re-fetch it by primary key
             if reminder.is_sent:
-                logger.debug(f"Reminder {reminder.id} already sent, skipping")
-                return True
-            
+                logger.debug("Reminder %s already sent, skipping", reminder.id)
+                return None
+
             # Compose the reminder message
             reply_text = (
                 f"⏰ Hey @{reminder.requester_username}, your reminder is here! "
                 f"You asked me to remind you about this {reminder.duration_text or 'a while'} ago. 🫡"
             )
-            
+
             # Send the reply with rate limit retry
             response = self._create_tweet_api(reply_text, reminder.reply_to_tweet_id)
-            
-            # Update the reminder
-            reminder.is_sent = True
-            reminder.sent_at = datetime.utcnow()
+
+            values = {
+                "id": reminder.id,
+                "is_sent": True,
+                "sent_at": datetime.utcnow(),
+                "reply_tweet_id": None,
+            }
             if response and response.data:
-                reminder.reply_tweet_id = str(response.data["id"])
-            
-            session.commit()
-            
+                values["reply_tweet_id"] = int(response.data["id"])
+
             logger.info(
-                f"Sent reminder to @{reminder.requester_username} "
-                f"(reminder ID: {reminder.id})"
+                "Sent reminder to @%s (reminder ID: %s)",
+                reminder.requester_username, reminder.id
             )
-            return True
-            
+            return values
+
         except tweepy.TweepyException as e:
-            logger.error(f"Error sending reminder {reminder.id}: {e}")
+            logger.error("Error sending reminder %s: %s", reminder.id, e)
             reminder.error_message = str(e)
-            session.commit()
-            return False
+            return None
         except Exception as e:
-            logger.error(f"Unexpected error sending reminder {reminder.id}: {e}")
-            session.rollback()
-            return False
-        finally:
-            session.close()
-    
+            logger.error("Unexpected error sending reminder %s: %s", reminder.id, e)
+            return None
+
     def process_due_reminders(self):
         """Check for and send all due reminders."""
-        logger.info("Checking for due reminders...")
-        reminders = self.get_due_reminders()
-        
-        if reminders:
-            logger.info(f"Found {len(reminders)} due reminder(s)")
-            for reminder in reminders:
-                self.send_reminder(reminder)
-        else:
+        now = datetime.utcnow()
+
+        # Fast path: nothing in the in-memory schedule has come due, so skip
+        # the database entirely this tick
+        if not self._due_heap or self._due_heap[0] > now:
             logger.debug("No due reminders")
+            return
+
+        # Pop the schedule entries that have come due; failed sends get
+        # pushed back below so they are retried next tick
+        popped = []
+        while self._due_heap and self._due_heap[0] <= now:
+            popped.append(heapq.heappop(self._due_heap))
+
+        logger.info("Checking for due reminders...")
+        try:
+            # One session covers the due query and every send/update
+            with session_scope() as session:
+                reminders = self.get_due_reminders(session)
+
+                if reminders:
+                    logger.info("Found %s due reminder(s)", len(reminders))
+                    sent_rows = []
+                    for reminder in reminders:
+                        values = self.send_reminder(reminder, session)
+                        if values:
+                            sent_rows.append(values)
+                        else:
+                            heapq.heappush(self._due_heap, reminder.remind_at)
+                    # One UPDATE-by-primary-key executemany marks the whole batch
+                    # sent; the session_scope commit is the tick's single fsync
+                    if sent_rows:
+                        session.execute(update(Reminder), sent_rows)
+                    # A full batch means more rows may still be due; re-arm the
+                    # heap so the next tick queries again instead of fast-pathing
+                    if len(reminders) == DUE_BATCH_LIMIT:
+                        heapq.heappush(self._due_heap, now)
+                else:
+                    logger.debug("No due reminders")
+        except Exception:
+            # A failed tick (e.g. transient DB error) must not lose the popped
+            # schedule entries, or the fast path above would skip these
+            # reminders until something else came due
+            for remind_at in popped:
+                heapq.heappush(self._due_heap, remind_at)
+            raise
     
-    def get_stats(self) -> dict:
-        """Get bot statistics."""
-        session = get_session()
+    def get_stats(self, session=None) -> dict:
+        """
+        Get bot statistics (cached for STATS_CACHE_TTL seconds).
+
+        If a session is provided, it is reused and left open for the caller.
+        """
+        now = time.monotonic()
+        if self._stats_cache and now - self._stats_cached_at < STATS_CACHE_TTL:
+            return self._stats_cache
+
+        owns_session = session is None
+        if owns_session:
+            session = get_session()
         try:
-            total_reminders = session.query(Reminder).count()
-            pending_reminders = session.query(Reminder).filter_by(is_sent=False).count()
-            sent_reminders = session.query(Reminder).filter_by(is_sent=True).count()
-            
-            return {
-                "total_reminders": total_reminders,
-                "pending_reminders": pending_reminders,
-                "sent_reminders": sent_reminders,
+            # One round-trip with conditional aggregation instead of three COUNT queries
+            total, pending, sent = session.execute(
+                select(
+                    func.count().label("total"),
+                    func.sum(case((Reminder.is_sent == False, 1), else_=0)).label("pending"),
+                    func.sum(case((Reminder.is_sent == True, 1), else_=0)).label("sent"),
+                ).select_from(Reminder)
+            ).one()
+
+            stats = {
+                "total_reminders": total or 0,
+                "pending_reminders": pending or 0,
+                "sent_reminders": sent or 0,
                 "bot_username": self.bot_username
             }
+            self._stats_cache = stats
+            self._stats_cached_at = now
+            return stats
         finally:
-            session.close()
+            if owns_session:
+                session.close()
 
 
 # Singleton bot instance
@@ -0,0 +1,20 @@
+"""Gunicorn configuration (picked up automatically from the working directory).
+
+The Procfile and render.yaml start Gunicorn with --preload: the app and its
+import graph are built once in the master and shared with the workers via
+fork, so workers start fast and share read-only memory. The one preloaded
+thing that must NOT be shared is the SQLAlchemy connection pool -- forked
+workers would otherwise interleave queries on the same TCP sockets.
+"""
+
+
+def post_fork(server, worker):
+    """Discard any connection pool inherited from the preloading master."""
+    import models
+
+    # Only touch the engine if the master actually created one (create_app's
+    # init_db does). dispose(close=False) drops the inherited pool without
+    # closing the sockets out from under the master; the worker's first
+    # checkout then opens fresh connections of its own.
+    if models._engine is not None:
+        models._engine.dispose(close=False)
@@ -1,7 +1,8 @@
 """Database models for storing reminders and tracking processed mentions."""
 
-from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Text
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, event, func, text, BigInteger, Column, Integer, String, DateTime, Boolean, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -14,14 +15,28 @@ class Reminder(Base):
     """A scheduled reminder to be posted at a specific time."""
     
     __tablename__ = "reminders"
-    
+
+    # Partial index over only the pending rows: the due-reminder and
+    # upcoming-reminder queries (WHERE is_sent = false AND/ORDER BY remind_at)
+    # become bounded range scans over an index that stays as small as the
+    # live backlog, no matter how much sent history accumulates
+    __table_args__ = (
+        Index(
+            "ix_reminders_pending",
+            "remind_at",
+            postgresql_where=text("is_sent = false"),
+            sqlite_where=text("is_sent = 0"),
+        ),
+    )
+
     id = Column(Integer, primary_key=True, autoincrement=True)
     
-    # The tweet ID that triggered this reminder
-    source_tweet_id = Column(String(50), unique=True, nullable=False, index=True)
+    # The tweet ID that triggered this reminder. Snowflake IDs fit in 64
+    # bits; BIGINT keeps rows and the unique index far smaller than strings
+    source_tweet_id = Column(BigInteger, unique=True, nullable=False, index=True)
     
     # The tweet ID we need to reply to (the parent of the mention)
-    reply_to_tweet_id = Column(String(50), nullable=False)
+    reply_to_tweet_id = Column(BigInteger, nullable=False)
     
     # User who requested the reminder
     requester_user_id = Column(String(50), nullable=False)
@@ -33,20 +48,20 @@ class Reminder(Base):
     # Parsed duration string (e.g., "3 months")
     duration_text = Column(String(200), nullable=True)
     
-    # When to send the reminder
-    remind_at = Column(DateTime, nullable=False, index=True)
+    # When to send the reminder (covered by ix_reminders_pending)
+    remind_at = Column(DateTime, nullable=False)
     
-    # When the reminder was created
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # When the reminder was created (computed by the database)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
-    # Whether the reminder has been sent
-    is_sent = Column(Boolean, default=False, nullable=False, index=True)
+    # Whether the reminder has been sent (covered by ix_reminders_pending)
+    is_sent = Column(Boolean, default=False, nullable=False)
     
     # When the reminder was sent (if sent)
     sent_at = Column(DateTime, nullable=True)
     
     # The tweet ID of our reply (if sent)
-    reply_tweet_id = Column(String(50), nullable=True)
+    reply_tweet_id = Column(BigInteger, nullable=True)
     
     # Error message if sending failed
     error_message = Column(Text, nullable=True)
@@ -61,8 +76,8 @@ class ProcessedMention(Base):
     __tablename__ = "processed_mentions"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    tweet_id = Column(String(50), unique=True, nullable=False, index=True)
-    processed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    tweet_id = Column(BigInteger, unique=True, nullable=False, index=True)
+    processed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     def __repr__(self):
         return f"<ProcessedMention {self.tweet_id}>"
@@ -76,7 +91,7 @@ class BotState(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     key = Column(String(100), unique=True, nullable=False)
     value = Column(Text, nullable=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     def __repr__(self):
         return f"<BotState {self.key}={self.value}>"
@@ -91,7 +106,29 @@ def get_engine():
     """Get or create the database engine (lazy initialization)."""
     global _engine
     if _engine is None:
-        _engine = create_engine(Config.DATABASE_URL, echo=False)
+        # pool_pre_ping swaps out dead pooled connections instead of letting
+        # them fail mid-job; pool_recycle stays below typical server-side
+        # idle timeouts. SQLite gets no sizing args -- it is a local file.
+        pool_kwargs = {"pool_pre_ping": True}
+        if not Config.DATABASE_URL.startswith("sqlite"):
+            pool_kwargs.update(
+                pool_size=10,
+                max_overflow=5,
+                pool_recycle=1800,
+            )
+        _engine = create_engine(Config.DATABASE_URL, echo=False, **pool_kwargs)
+
+        if Config.DATABASE_URL.startswith("sqlite"):
+            # WAL lets the Flask reader and the scheduler writer run
+            # concurrently instead of serializing on the rollback journal
+            @event.listens_for(_engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.close()
+
     return _engine
 
 
@@ -129,6 +166,25 @@ def get_session():
     return get_session_factory()()
 
 
+@contextmanager
+def session_scope():
+    """
+    Provide a transactional scope around a unit of work.
+
+    One session (and connection checkout) covers everything done inside the
+    block; commits on error are rolled back and the session is always closed.
+    """
+    session = get_session()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 if __name__ == "__main__":
     init_db()
 
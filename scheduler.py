@@ -1,11 +1,15 @@
 """Scheduler for running periodic bot tasks with optimized intervals."""
 
+import itertools
 import logging
-import random
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Iterator, Optional
+
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from bot import get_bot
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -13,51 +17,77 @@ logger = logging.getLogger(__name__)
 # Global scheduler instance
 scheduler = None
 
+
+@dataclass(slots=True)
+class JobStats:
+    """
+    Job statistics, mutated from both scheduler threads.
+
+    The totals advance through itertools.count iterators: next() is a single
+    atomic operation under the GIL, so concurrent ticks can't lose an
+    increment the way a dict's read-add-store += could.
+    """
+
+    mentions_checked: int = 0
+    reminders_processed: int = 0
+    errors: int = 0
+    last_mention_check: Optional[datetime] = None
+    last_reminder_check: Optional[datetime] = None
+    _mention_count: Iterator[int] = field(default_factory=lambda: itertools.count(1), repr=False)
+    _reminder_count: Iterator[int] = field(default_factory=lambda: itertools.count(1), repr=False)
+    _error_count: Iterator[int] = field(default_factory=lambda: itertools.count(1), repr=False)
+
+    def record_mention_check(self):
+        self.mentions_checked = next(self._mention_count)
+        self.last_mention_check = datetime.utcnow()
+
+    def record_reminder_check(self):
+        self.reminders_processed = next(self._reminder_count)
+        self.last_reminder_check = datetime.utcnow()
+
+    def record_error(self):
+        self.errors = next(self._error_count)
+
+    def current(self) -> dict:
+        """Snapshot the statistics as a JSON-serializable dict."""
+        return {
+            "mentions_checked": self.mentions_checked,
+            "reminders_processed": self.reminders_processed,
+            "errors": self.errors,
+            "last_mention_check": self.last_mention_check.isoformat() if self.last_mention_check else None,
+            "last_reminder_check": self.last_reminder_check.isoformat() if self.last_reminder_check else None,
+        }
+
+
 # Track job statistics
-job_stats = {
-    "mentions_checked": 0,
-    "reminders_processed": 0,
-    "last_mention_check": None,
-    "last_reminder_check": None,
-    "errors": 0
-}
+job_stats = JobStats()
 
 
 def check_mentions_job():
     """Job to check for new mentions with statistics tracking."""
-    global job_stats
     try:
-        from bot import get_bot
         bot = get_bot()
         bot.check_mentions()
-        job_stats["mentions_checked"] += 1
-        job_stats["last_mention_check"] = datetime.utcnow()
+        job_stats.record_mention_check()
     except Exception as e:
-        job_stats["errors"] += 1
-        logger.error(f"Error in check_mentions_job: {e}", exc_info=True)
+        job_stats.record_error()
+        logger.error("Error in check_mentions_job: %s", e, exc_info=True)
 
 
 def process_reminders_job():
     """Job to process due reminders with statistics tracking."""
-    global job_stats
     try:
-        from bot import get_bot
         bot = get_bot()
         bot.process_due_reminders()
-        job_stats["reminders_processed"] += 1
-        job_stats["last_reminder_check"] = datetime.utcnow()
+        job_stats.record_reminder_check()
     except Exception as e:
-        job_stats["errors"] += 1
-        logger.error(f"Error in process_reminders_job: {e}", exc_info=True)
+        job_stats.record_error()
+        logger.error("Error in process_reminders_job: %s", e, exc_info=True)
 
 
 def get_job_stats() -> dict:
     """Get current job statistics."""
-    return {
-        **job_stats,
-        "last_mention_check": job_stats["last_mention_check"].isoformat() if job_stats["last_mention_check"] else None,
-        "last_reminder_check": job_stats["last_reminder_check"].isoformat() if job_stats["last_reminder_check"] else None,
-    }
+    return job_stats.current()
 
 
 def start_scheduler():
@@ -69,39 +99,42 @@ def start_scheduler():
         return scheduler
     
     scheduler = BackgroundScheduler()
-    
-    # Add jitter to prevent thundering herd on startup
-    # Stagger the jobs so they don't all fire at the same time
-    mention_jitter = random.uniform(0, 5)  # 0-5 second random delay
-    reminder_jitter = random.uniform(5, 10)  # 5-10 second random delay (offset from mentions)
-    
-    # Add job to check mentions (optimized to 30s default)
+
+    # Add job to check mentions (optimized to 30s default). The jitter lives
+    # on the trigger -- add_job only forwards trigger kwargs for string
+    # aliases, so a jitter= alongside a trigger instance is silently dropped.
+    # The trigger re-randomizes it on every fire, which keeps the two
+    # equal-interval jobs from firing in lockstep.
     scheduler.add_job(
         check_mentions_job,
-        trigger=IntervalTrigger(seconds=Config.MENTION_CHECK_INTERVAL),
+        trigger=IntervalTrigger(seconds=Config.MENTION_CHECK_INTERVAL, jitter=5),
         id="check_mentions",
         name="Check for new mentions",
         replace_existing=True,
         next_run_time=datetime.utcnow(),  # Run immediately on startup
-        jitter=int(mention_jitter)
+        coalesce=True,       # collapse a backlog of missed runs into one
+        max_instances=1,     # never overlap a slow tick with the next one
+        misfire_grace_time=30
     )
-    
+
     # Add job to process due reminders (optimized to 30s default)
     scheduler.add_job(
         process_reminders_job,
-        trigger=IntervalTrigger(seconds=Config.REMINDER_CHECK_INTERVAL),
+        trigger=IntervalTrigger(seconds=Config.REMINDER_CHECK_INTERVAL, jitter=5),
         id="process_reminders",
         name="Process due reminders",
         replace_existing=True,
         next_run_time=datetime.utcnow(),  # Run immediately on startup
-        jitter=int(reminder_jitter)
+        coalesce=True,       # collapse a backlog of missed runs into one
+        max_instances=1,     # never overlap a slow tick with the next one
+        misfire_grace_time=30
     )
     
     scheduler.start()
     logger.info(
-        f"Scheduler started with optimized intervals. "
-        f"Checking mentions every {Config.MENTION_CHECK_INTERVAL}s, "
-        f"processing reminders every {Config.REMINDER_CHECK_INTERVAL}s"
+        "Scheduler started with optimized intervals. "
+        "Checking mentions every %ss, processing reminders every %ss",
+        Config.MENTION_CHECK_INTERVAL, Config.REMINDER_CHECK_INTERVAL
     )
     
     return scheduler
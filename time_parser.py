@@ -1,30 +1,85 @@
 """Parse natural language time durations into datetime objects."""
 
+import functools
 import re
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 
 import parsedatetime
 from dateutil.relativedelta import relativedelta
 
+# Every accepted unit spelling mapped to its canonical unit
+_UNIT_ALIASES = {
+    "s": "seconds", "sec": "seconds", "secs": "seconds",
+    "second": "seconds", "seconds": "seconds",
+    "m": "minutes", "min": "minutes", "mins": "minutes",
+    "minute": "minutes", "minutes": "minutes",
+    "h": "hours", "hr": "hours", "hrs": "hours",
+    "hour": "hours", "hours": "hours",
+    "d": "days", "day": "days", "days": "days",
+    "w": "weeks", "wk": "weeks", "wks": "weeks",
+    "week": "weeks", "weeks": "weeks",
+    "mo": "months", "mos": "months",
+    "month": "months", "months": "months",
+    "y": "years", "yr": "years", "yrs": "years",
+    "year": "years", "years": "years",
+}
+
+# Duration buckets for format_duration: upper cutoffs (exclusive) found with
+# bisect, parallel to the (divisor, unit name) used for each bucket
+_BUCKET_CUTOFFS = (60, 3600, 86400, 604800, 2592000, 31536000)
+_BUCKET_UNITS = (
+    (1, "second"),
+    (60, "minute"),
+    (3600, "hour"),
+    (86400, "day"),
+    (604800, "week"),
+    (2592000, "month"),   # ~30 days
+    (31536000, "year"),   # ~365 days
+)
+
+# Reference for converting naive UTC datetimes to minute buckets
+_EPOCH = datetime(1970, 1, 1)
+
+# Leading words that mark text parsedatetime understands as-is; anything else
+# reaching the fallback reads like a bare duration and parses as "in <text>"
+_SELF_CONTAINED_PREFIXES = ("in ", "next ", "tomorrow", "today", "tonight", "on ", "at ")
+
+# Canonical unit -> delta constructor; months/years need calendar arithmetic
+_DURATION_FACTORIES = {
+    "seconds": lambda n: timedelta(seconds=n),
+    "minutes": lambda n: timedelta(minutes=n),
+    "hours": lambda n: timedelta(hours=n),
+    "days": lambda n: timedelta(days=n),
+    "weeks": lambda n: timedelta(weeks=n),
+    "months": lambda n: relativedelta(months=n),
+    "years": lambda n: relativedelta(years=n),
+}
+
 
 class TimeParser:
     """Parse natural language time expressions into future datetime objects."""
-    
+
     def __init__(self):
         self.cal = parsedatetime.Calendar()
-        
-        # Common patterns for explicit durations
-        self.duration_patterns = [
-            # "3 months", "1 year", "2 weeks", etc.
-            (r"(\d+)\s*(second|sec|s)s?", "seconds"),
-            (r"(\d+)\s*(minute|min|m)s?", "minutes"),
-            (r"(\d+)\s*(hour|hr|h)s?", "hours"),
-            (r"(\d+)\s*(day|d)s?", "days"),
-            (r"(\d+)\s*(week|wk|w)s?", "weeks"),
-            (r"(\d+)\s*(month|mo)s?", "months"),
-            (r"(\d+)\s*(year|yr|y)s?", "years"),
-        ]
+
+        # One compiled alternation covering every unit alias (longest spellings
+        # first) instead of seven separate regex passes over the text
+        self._duration_re = re.compile(
+            r"(\d+)\s*"
+            r"(seconds?|secs?|minutes?|mins?|hours?|hrs?|days?"
+            r"|weeks?|wks?|months?|mos?|years?|yrs?|[smhdwy])\b",
+            re.IGNORECASE,
+        )
+
+        # Precompiled so parse() skips the re-cache probe on every call
+        self._mention_re = re.compile(r"@\w+")
+
+        # "<number> <word>" inputs are fully covered by the explicit duration
+        # patterns, so when those fail there is no point consulting
+        # parsedatetime (see parse)
+        self._numeric_only = re.compile(r"^\s*\d+\s*[a-z]+\s*$", re.IGNORECASE)
     
     def parse(self, text: str, base_time: Optional[datetime] = None) -> Tuple[Optional[datetime], Optional[str]]:
         """
@@ -39,80 +94,72 @@ class TimeParser:
         """
         if base_time is None:
             base_time = datetime.utcnow()
-        
-        # Clean and normalize the text
-        text = text.lower().strip()
-        
-        # Remove the bot mention if present
-        text = re.sub(r"@\w+", "", text).strip()
-        
+
+        # Strip the bot mention, then normalize in one pass; @\w+ is ASCII-only
+        # so lowercasing after the sub is equivalent
+        text = self._mention_re.sub("", text).strip().lower()
+
+        # Popular durations ("3 months", "1 week") repeat constantly, so the
+        # real parse runs through an LRU cache keyed on the normalized text
+        # and the minute bucket of base_time. Entries store the offset from
+        # the bucket rather than an absolute time so they stay valid.
+        base_minute = int((base_time - _EPOCH).total_seconds()) // 60
+        delta_seconds, matched_text = _parse_cached(text, base_minute)
+        if delta_seconds is None:
+            return None, None
+        return base_time + timedelta(seconds=delta_seconds), matched_text
+
+    def _parse_normalized(self, text: str, base_time: datetime) -> Tuple[Optional[datetime], Optional[str]]:
+        """Run the parsing pipeline on already-normalized text."""
         # Try explicit duration patterns first
         result = self._parse_explicit_duration(text, base_time)
         if result[0]:
             return result
-        
+
+        # "3 foo" style junk can't be rescued by the natural-language parser;
+        # skip the three comparatively expensive parsedatetime attempts
+        if self._numeric_only.match(text):
+            return None, None
+
         # Fall back to parsedatetime for natural language
         result = self._parse_natural_language(text, base_time)
         if result[0]:
             return result
-        
+
         return None, None
-    
+
     def _parse_explicit_duration(self, text: str, base_time: datetime) -> Tuple[Optional[datetime], Optional[str]]:
         """Parse explicit duration patterns like '3 months' or '2 weeks'."""
-        
-        for pattern, unit in self.duration_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount = int(match.group(1))
-                matched_text = match.group(0)
-                
-                if unit == "seconds":
-                    delta = timedelta(seconds=amount)
-                elif unit == "minutes":
-                    delta = timedelta(minutes=amount)
-                elif unit == "hours":
-                    delta = timedelta(hours=amount)
-                elif unit == "days":
-                    delta = timedelta(days=amount)
-                elif unit == "weeks":
-                    delta = timedelta(weeks=amount)
-                elif unit == "months":
-                    delta = relativedelta(months=amount)
-                elif unit == "years":
-                    delta = relativedelta(years=amount)
-                else:
-                    continue
-                
-                target_time = base_time + delta
-                return target_time, matched_text
-        
-        return None, None
+
+        match = self._duration_re.search(text)
+        if not match:
+            return None, None
+
+        amount = int(match.group(1))
+        unit = _UNIT_ALIASES[match.group(2).lower()]
+        target_time = base_time + _DURATION_FACTORIES[unit](amount)
+        return target_time, match.group(0)
     
     def _parse_natural_language(self, text: str, base_time: datetime) -> Tuple[Optional[datetime], Optional[str]]:
         """Parse natural language time expressions using parsedatetime."""
-        
-        # Common phrases to try
-        phrases_to_try = [
-            text,
-            f"in {text}",
-            f"{text} from now",
-        ]
-        
-        for phrase in phrases_to_try:
-            try:
-                time_struct, parse_status = self.cal.parse(phrase, base_time)
-                
-                # parse_status > 0 means something was parsed
-                if parse_status > 0:
-                    parsed_time = datetime(*time_struct[:6])
-                    
-                    # Only accept future times
-                    if parsed_time > base_time:
-                        return parsed_time, text
-            except Exception:
-                continue
-        
+
+        # Each Calendar.parse is a full grammar walk, so classify the text
+        # once and make a single call instead of trying phrase variants
+        phrase = text if text.startswith(_SELF_CONTAINED_PREFIXES) else f"in {text}"
+
+        try:
+            time_struct, parse_status = self.cal.parse(phrase, base_time)
+
+            # parse_status > 0 means something was parsed
+            if parse_status > 0:
+                parsed_time = datetime(*time_struct[:6])
+
+                # Only accept future times
+                if parsed_time > base_time:
+                    return parsed_time, text
+        except Exception:
+            pass
+
         return None, None
     
     def format_duration(self, target_time: datetime, base_time: Optional[datetime] = None) -> str:
@@ -123,33 +170,31 @@ class TimeParser:
         
         delta = target_time - base_time
         total_seconds = int(delta.total_seconds())
-        
-        if total_seconds < 60:
-            return f"{total_seconds} second{'s' if total_seconds != 1 else ''}"
-        elif total_seconds < 3600:
-            minutes = total_seconds // 60
-            return f"{minutes} minute{'s' if minutes != 1 else ''}"
-        elif total_seconds < 86400:
-            hours = total_seconds // 3600
-            return f"{hours} hour{'s' if hours != 1 else ''}"
-        elif total_seconds < 604800:
-            days = total_seconds // 86400
-            return f"{days} day{'s' if days != 1 else ''}"
-        elif total_seconds < 2592000:  # ~30 days
-            weeks = total_seconds // 604800
-            return f"{weeks} week{'s' if weeks != 1 else ''}"
-        elif total_seconds < 31536000:  # ~365 days
-            months = total_seconds // 2592000
-            return f"{months} month{'s' if months != 1 else ''}"
-        else:
-            years = total_seconds // 31536000
-            return f"{years} year{'s' if years != 1 else ''}"
+
+        divisor, unit = _BUCKET_UNITS[bisect_right(_BUCKET_CUTOFFS, total_seconds)]
+        amount = total_seconds // divisor
+        return f"{amount} {unit}{'s' if amount != 1 else ''}"
 
 
 # Singleton instance
 time_parser = TimeParser()
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(normalized_text: str, base_minute: int) -> Tuple[Optional[float], Optional[str]]:
+    """
+    Memoized parse of normalized text against a minute-bucketed base time.
+
+    Returns (delta_seconds, matched_text) so the caller can rebuild the
+    target from its own base_time, or (None, None) if parsing failed.
+    """
+    base_time = _EPOCH + timedelta(minutes=base_minute)
+    target_time, matched_text = time_parser._parse_normalized(normalized_text, base_time)
+    if target_time is None:
+        return None, None
+    return (target_time - base_time).total_seconds(), matched_text
+
+
 def parse_reminder_time(text: str) -> Tuple[Optional[datetime], Optional[str]]:
     """
     Convenience function to parse a reminder time from text.
@@ -1,9 +1,12 @@
 """WSGI entry point for Gunicorn."""
 
-# Python 3.13 compatibility: imghdr was removed, provide a shim
+# Python 3.13 compatibility: imghdr was removed there, so install the shim
+# only where it's actually missing -- older runtimes keep the real module
 import sys
-import imghdr_shim
-sys.modules['imghdr'] = imghdr_shim
+
+if sys.version_info >= (3, 13):
+    import imghdr_shim
+    sys.modules['imghdr'] = imghdr_shim
 
 from app import create_app
 